@@ -0,0 +1,10 @@
+# Cython declarations for _crt.py. These are only used when ndindex is built
+# with Cython (see setup.py), and make the calls between these functions C
+# calls instead of Python calls. The arithmetic itself is left untyped, since
+# the values can be arbitrarily large integers.
+import cython
+
+@cython.locals(x_sign=cython.int, y_sign=cython.int)
+cpdef tuple gcdex(a, b)
+
+cpdef _crt(U, M, bint check=*)
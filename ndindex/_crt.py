@@ -44,9 +44,8 @@ OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH
 DAMAGE.
 """
 
-from functools import reduce
-from operator import mul
 from math import gcd
+from operator import itemgetter
 
 def gcdex(a, b):
     """Returns x, y, g such that g = x*a + y*b = gcd(a, b).
@@ -88,17 +87,15 @@ def gcdex(a, b):
     x, y, r, s = 1, 0, 0, 1
 
     while b:
-        (c, q) = (a % b, a // b)
-        (a, b, r, s, x, y) = (b, c, x - q*r, y - q*s, r, s)
+        q, c = divmod(a, b)
+        a, b = b, c
+        x, r = r, x - q*r
+        y, s = s, y - q*s
 
     return (x*x_sign, y*y_sign, a)
 
 
-# np.prod has overflow and math.prod is Python 3.8+ only
-def prod(seq):
-    return reduce(mul, seq, 1)
-
-def _crt(U, M):
+def _crt(U, M, check=False):
     """
     Chinese Remainder Theorem.
 
@@ -106,6 +103,9 @@ def _crt(U, M):
     co-prime integer moduli ``m_0,...,m_n``, returns an integer
     ``u``, such that ``u = u_i mod m_i`` for ``i = ``0,...,n``.
 
+    If ``check`` is True, None is returned if the moduli are found not to be
+    co-prime (in which case the result would not necessarily be correct).
+
     Examples
     ========
 
@@ -122,17 +122,28 @@ def _crt(U, M):
        >>> [639985 % m for m in [99, 97, 95]]
        [49, 76, 65]
 
-    Note: this is a low-level routine with no error checking.
+    >>> _crt([2, 5], [3, 6], check=True) is None
+    True
+
+    Note: this is a low-level routine with no other error checking.
     """
-    p = prod(M)
-    v = 0
+    # Garner's algorithm: fold the congruences in one at a time, so that each
+    # gcdex call only involves operands of the size of a single modulus,
+    # rather than the full product of the moduli.
+    v, p = 0, 1
 
     for u, m in zip(U, M):
-        e = p // m
-        s, _, _ = gcdex(e, m)
-        v += e*(u*s % m)
+        try:
+            s = pow(p % m, -1, m)
+        except ValueError:
+            # The moduli are not coprime
+            if check:
+                return None
+            s, _, _ = gcdex(p % m, m)
+        v += p*((u - v)*s % m)
+        p *= m
 
-    return v % p
+    return v
 
 
 def solve_congruence(*remainder_modulus_pairs):
@@ -182,28 +193,29 @@ def solve_congruence(*remainder_modulus_pairs):
         """
         a1, m1 = c1
         a2, m2 = c2
-        a, b, c = m1, a2 - a1, m2
-        g = reduce(gcd, [a, b, c])
-        a, b, c = [i//g for i in [a, b, c]]
-        if a != 1:
-            inv_a, _, g = gcdex(a, c)
-            if g != 1:
-                return None
-            b *= inv_a
-        a, m = a1 + m1*b, m1*c
+        g = gcd(m1, m2)
+        b = a2 - a1
+        if b % g:
+            return None
+        # m1//g and m2//g are coprime, so the inverse always exists.
+        inv_a = pow(m1//g, -1, m2//g)
+        m = m1//g*m2
+        a = (a1 + m1*(b//g)*inv_a) % m
         return a, m
 
-    rm = remainder_modulus_pairs
+    # The solution does not depend on the order of the pairs. Combining the
+    # smallest moduli first keeps the intermediate values small for longer.
+    rm = sorted(remainder_modulus_pairs, key=itemgetter(1))
 
-    rv = (0, 1)
-    for rmi in rm:
+    # Start from the first pair rather than combining it with (0, 1), and
+    # rely on combine() to return a reduced remainder.
+    a, m = rm[0]
+    rv = (a % m, m)
+    for rmi in rm[1:]:
         rv = combine(rv, rmi)
         if rv is None:
-            break
-        n, m = rv
-        n = n % m
-    else:
-        return n
+            return None
+    return rv[0]
 
 def crt(m, v, check=True):
     r"""Chinese Remainder Theorem.
@@ -239,9 +251,9 @@ def crt(m, v, check=True):
     if you use ``check=False``:
 
        >>> crt([12, 6, 17], [3, 4, 2], check=False)
-       954
-       >>> [954 % m for m in [12, 6, 17]]
-       [6, 0, 2]
+       291
+       >>> [291 % m for m in [12, 6, 17]]
+       [3, 3, 2]
        >>> crt([12, 6, 17], [3, 4, 2]) is None
        True
        >>> crt([3, 6], [2, 5])
@@ -252,14 +264,30 @@ def crt(m, v, check=True):
 
     Programmer's note: rather than checking that all pairs of moduli share
     no GCD (an O(n**2) test) and rather than factoring all moduli and seeing
-    that there is no factor in common, a check that the result gives the
-    indicated residuals is performed -- an O(n) operation.
+    that there is no factor in common, the running modulus in _crt is checked
+    to be coprime to each new modulus. This falls out of computing the
+    modular inverse that is needed anyway, so no separate pass to verify the
+    result is needed.
     """
-    result = _crt(v, m)
-
-    if check:
-        if not all(v % m == result % m for v, m in zip(v, m)):
-            result = solve_congruence(*list(zip(v, m)))
+    if len(m) == 1:
+        return v[0] % m[0]
+    if len(m) == 2:
+        # This is the case used by ndindex (see subindex_helpers.py), so
+        # avoid the overhead of the general loop in _crt.
+        (m1, m2), (v1, v2) = m, v
+        try:
+            inv = pow(m1 % m2, -1, m2)
+        except ValueError:
+            # The moduli are not coprime
+            if check:
+                return solve_congruence((v1, m1), (v2, m2))
+        else:
+            return (v1 + m1*((v2 - v1)*inv % m2)) % (m1*m2)
+
+    result = _crt(v, m, check=check)
+
+    if result is None:
+        result = solve_congruence(*zip(v, m))
 
     return result
 
@@ -13,7 +13,7 @@ class ArrayIndex(NDIndex):
     To subclass this, define the `dtype` attribute, as well as all the usual
     ndindex methods.
     """
-    __slots__ = ()
+    __slots__ = ('_hash',)
 
     # Subclasses should redefine this
     dtype = None
@@ -48,7 +48,11 @@ class ArrayIndex(NDIndex):
                                         message='Creating an ndarray from ragged nested sequences')
                 a = asarray(idx)
                 if a is idx and _copy:
-                    a = a.copy()
+                    # Make the copy C contiguous, so that the array
+                    # operations on the index use a single linear pass over
+                    # memory. _copy=False is used for broadcasted arrays,
+                    # which should not be made contiguous.
+                    a = a.copy(order='C')
                 if isinstance(idx, list) and 0 in a.shape:
                     if not _copy:
                         raise ValueError("_copy=False is not allowed with list input")
@@ -165,8 +169,18 @@ class ArrayIndex(NDIndex):
                 + array2string(self.array).replace('\n', '')
                 + ")")
 
+    def __reduce__(self):
+        # Only pickle the args. Otherwise the cache slots (like _hash, which
+        # is salted per process) would be pickled along with the object.
+        return (type(self), self.args)
+
     def __hash__(self):
-        return hash(self.array.tobytes())
+        # The array is immutable, so the hash only needs to be computed once.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.array.tobytes(), self.shape))
+            return self._hash
 
     def isvalid(self, shape, _axis=0):
         shape = asshape(shape)
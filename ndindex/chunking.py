@@ -9,7 +9,7 @@ from .integerarray import IntegerArray
 from .newaxis import Newaxis
 from .shapetools import asshape
 from .subindex_helpers import ceiling
-from ._crt import prod
+from math import prod
 
 class ChunkSize(ImmutableObject, Sequence):
     """
@@ -40,7 +40,7 @@ class IntegerArray(ArrayIndex):
        :any:`type-confusion` for more details.
 
     """
-    __slots__ = ()
+    __slots__ = ('_bounds', '_reduced')
 
     @property
     def dtype(self):
@@ -51,11 +51,29 @@ class IntegerArray(ArrayIndex):
         from numpy import intp
         return intp
 
+    def _minmax(self):
+        # The array is immutable, so the minimum and maximum entries only
+        # need to be computed once. This makes repeated bounds checks (e.g.,
+        # from reduce(), newshape() and isempty()) O(1). An empty array gives
+        # (0, -1), which is in bounds for any size.
+        try:
+            return self._bounds
+        except AttributeError:
+            a = self.array
+            if a.size == 0:
+                self._bounds = (0, -1)
+            else:
+                self._bounds = (int(a.min()), int(a.max()))
+            return self._bounds
+
     def _raise_indexerror(self, shape, axis=0):
         size = shape[axis]
-        out_of_bounds = (self.array >= size) | ((-size > self.array) & (self.array < 0))
-        if out_of_bounds.any():
-            raise IndexError(f"index {self.array[out_of_bounds].flat[0]} is out of bounds for axis {axis} with size {size}")
+        amin, amax = self._minmax()
+        if amin >= -size and amax < size:
+            return
+        a = self.array
+        out_of_bounds = (a >= size) | (a < -size)
+        raise IndexError(f"index {a[out_of_bounds].flat[0]} is out of bounds for axis {axis} with size {size}")
 
     def reduce(self, shape=None, *, axis=0, negative_int=False):
         """
@@ -101,15 +119,41 @@ class IntegerArray(ArrayIndex):
 
         shape = asshape(shape, axis=axis)
 
-        self._raise_indexerror(shape, axis)
-
         size = shape[axis]
-        new_array = self.array.copy()
+        amin, amax = self._minmax()
+        if amin < -size or amax >= size:
+            self._raise_indexerror(shape, axis)
+
+        # If the entries already have the right sign (including when there
+        # are no entries), the index is already reduced and can be returned
+        # as is (it is immutable).
+        if negative_int:
+            if amax < 0:
+                return self
+        else:
+            if amin >= 0:
+                return self
+
+        # Otherwise, the result only depends on size and negative_int, so
+        # reuse the result of the last call if they are the same.
+        try:
+            last_size, last_negative_int, res = self._reduced
+            if last_size == size and last_negative_int == negative_int:
+                return res
+        except AttributeError:
+            pass
+
+        from numpy import where
+
+        a = self.array
         if negative_int:
-            new_array[new_array >= 0] -= size
+            new_array = where(a >= 0, a - size, a)
         else:
-            new_array[new_array < 0] += size
-        return IntegerArray(new_array)
+            new_array = where(a < 0, a + size, a)
+        # new_array is a fresh array, so there is no need to copy it again
+        res = IntegerArray(new_array, _copy=False)
+        self._reduced = (size, negative_int, res)
+        return res
 
     def newshape(self, shape):
         # The docstring for this method is on the NDIndex base class
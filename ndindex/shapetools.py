@@ -1,7 +1,7 @@
 import numbers
 import itertools
 from collections.abc import Sequence
-from ._crt import prod
+from math import prod
 
 from .ndindex import ndindex, operator_index
 
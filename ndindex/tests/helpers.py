@@ -17,7 +17,7 @@ from hypothesis.extra.numpy import (arrays, mutually_broadcastable_shapes as
 
 from ..ndindex import ndindex
 from ..shapetools import remove_indices, unremove_indices
-from .._crt import prod
+from math import prod
 
 # Hypothesis strategies for generating indices. Note that some of these
 # strategies are nominally already defined in hypothesis, but we redefine them
@@ -1,9 +1,12 @@
-from numpy import intp, array, int16
+import pickle
+
+from numpy import intp, array, int16, arange
 
 from pytest import raises
 
 from ..array import ArrayIndex
 from ..integerarray import IntegerArray
+from ..booleanarray import BooleanArray
 
 from .helpers import assert_equal
 
@@ -36,3 +39,45 @@ def test_copy():
     assert idx.raw is idx3.raw
     raises(ValueError, lambda: IntegerArray([], _copy=False))
     raises(ValueError, lambda: IntegerArray(array([1], dtype=int16), _copy=False))
+
+def test_contiguous():
+    a = array([[0, 1], [1, 0]], order='F')
+    idx = IntegerArray(a)
+    assert idx.array.flags.c_contiguous
+    assert_equal(idx.array, a)
+
+    a = array([[0, 1], [1, 0]], dtype=int16)[:, ::-1]
+    idx = IntegerArray(a)
+    assert idx.array.flags.c_contiguous
+    assert_equal(idx.array, array(a, dtype=intp))
+
+def test_hash():
+    assert hash(IntegerArray([0, 1])) == hash(IntegerArray(array([0, 1])))
+    assert hash(IntegerArray([[0, 1]])) != hash(IntegerArray([0, 1]))
+
+def test_pickle():
+    for idx in [IntegerArray([1, 2, -1]), IntegerArray([[0, 1]]),
+                BooleanArray([True, False])]:
+        h = hash(idx)
+        idx2 = pickle.loads(pickle.dumps(idx))
+        assert idx2 == idx
+        assert hash(idx2) == h
+        assert {idx: 1}.get(idx2) == 1
+
+def test_pickle_cache():
+    idx = IntegerArray(arange(-10, 0))
+    hash(idx)
+    reduced = idx.reduce((10,))
+    assert idx.reduce((10,)) is reduced
+
+    size = len(pickle.dumps(IntegerArray(arange(-10, 0))))
+    assert len(pickle.dumps(idx)) == size
+
+    # The cache is rebuilt instead of being restored from the pickle
+    idx2 = pickle.loads(pickle.dumps(idx))
+    for attr in ['_hash', '_bounds', '_reduced']:
+        assert not hasattr(idx2, attr)
+    reduced2 = idx2.reduce((10,))
+    assert reduced2 is not reduced
+    assert reduced2 == reduced
+    assert idx2.reduce((10,)) is reduced2
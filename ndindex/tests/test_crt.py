@@ -1,9 +1,10 @@
+from itertools import combinations
 from math import gcd
 
-from .._crt import crt, ilcm, gcdex
+from .._crt import crt, ilcm, gcdex, solve_congruence
 
 from hypothesis import given, example
-from hypothesis.strategies import integers, lists, shared
+from hypothesis.strategies import integers, lists, shared, tuples
 
 size = shared(integers(min_value=1, max_value=10))
 @given(
@@ -20,6 +21,37 @@ def test_crt(m, v):
     for m_i, v_i in zip(m, v):
         assert v_i % m_i == res % m_i
 
+@example([3, 6], [2, 5])
+@given(
+    size.flatmap(lambda s: lists(integers(min_value=1), min_size=s, max_size=s)),
+    size.flatmap(lambda s: lists(integers(), min_size=s, max_size=s)),
+)
+def test_crt_nocheck(m, v):
+    res = crt(m, v, check=False)
+
+    # The result is only guaranteed to be correct for coprime moduli
+    if all(gcd(m_i, m_j) == 1 for m_i, m_j in combinations(m, 2)):
+        for m_i, v_i in zip(m, v):
+            assert v_i % m_i == res % m_i
+
+@given(lists(tuples(integers(), integers(min_value=1, max_value=100)),
+             min_size=1, max_size=4))
+def test_solve_congruence(rm):
+    res = solve_congruence(*rm)
+
+    if res is None:
+        # Check that there really is no solution
+        L = 1
+        for _, m_i in rm:
+            L = ilcm(L, m_i)
+        if L <= 10**5:
+            for n in range(L):
+                assert not all(n % m_i == r_i % m_i for r_i, m_i in rm)
+        return
+
+    for r_i, m_i in rm:
+        assert r_i % m_i == res % m_i
+
 @example(1, 2)
 @given(integers(min_value=0), integers(min_value=0))
 def test_ilcm(x, y):
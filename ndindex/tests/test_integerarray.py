@@ -60,6 +60,9 @@ def test_integerarray_reduce_no_shape_unchanged(idx):
 
 
 @example(array([2, -2]), (4,), {'negative_int': True})
+@example(array([2, -2]), (4,), {})
+@example(array([-1, -2]), (4,), {'negative_int': True})
+@example(array([1, 2]), (4,), {})
 @example(array(2), (4,), {'negative_int': True})
 @example(array([2, 0]), (1, 0), {})
 @example(array(0), 1, {})
@@ -93,6 +96,8 @@ def test_integerarray_reduce_hypothesis(idx, shape, kwargs):
                 assert (reduced.raw < 0).all()
             else:
                 assert (reduced.raw >= 0).all()
+            # Repeated calls reuse the same result
+            assert index.reduce(shape, **kwargs) is reduced
 
         # Idempotency
         assert reduced.reduce(**kwargs) == reduced
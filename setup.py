@@ -1,5 +1,8 @@
+import importlib.util
 import os
+import shutil
 import sys
+import sysconfig
 import setuptools
 import versioneer
 
@@ -12,20 +15,29 @@ def check_cython():
     Check to see if Cython is installed and able to compile extensions (which
     requires a C compiler and the Python headers to be installed).
     Return True on success, False on failure.
+
+    This only checks that these are present, rather than building a test
+    extension, which would run a whole separate build.
     """
-    argv_org = list(sys.argv)
+    if importlib.util.find_spec('Cython') is None:
+        return False
+
     try:
-        from Cython.Build import cythonize
-        sys.argv = argv_org[:1] + ["build_ext"]
-        setuptools.setup(name="foo", version="1.0.0",
-                         ext_modules=cythonize(
-                             ["ndindex/__init__.py"],
-                             language_level="3"))
-    except:
+        from distutils.ccompiler import new_compiler
+        from distutils.sysconfig import customize_compiler
+
+        compiler = new_compiler()
+        customize_compiler(compiler)
+        # MSVC does not set compiler_so, and finds the compiler itself when
+        # it is used.
+        compiler_so = getattr(compiler, 'compiler_so', None)
+        if compiler_so and not shutil.which(compiler_so[0]):
+            return False
+    except Exception:
         return False
-    finally:
-        sys.argv = argv_org
-    return True
+
+    include = sysconfig.get_paths()['include']
+    return os.path.exists(os.path.join(include, 'Python.h'))
 
 CYTHONIZE_NDINDEX = os.getenv("CYTHONIZE_NDINDEX")
 if CYTHONIZE_NDINDEX is None: